@@ -0,0 +1,21 @@
+from sqlalchemy.orm import Session
+from main import SessionLocal, rebuild_usage_aggregate, rebuild_user_quota_usage
+
+def backfill_usage():
+    db: Session = SessionLocal()
+    try:
+        print("🚀 ProjectHistory 기반으로 사용량 집계(usage_aggregate)를 재계산합니다...")
+        agg = rebuild_usage_aggregate(db)
+        print(f"✅ 집계 완료: 프로젝트 {agg.total_projects}개 / vCPU {agg.used_vcpu} / Memory {agg.used_memory}GB")
+
+        print("🚀 사용자별 쿼터 사용량(user_quotas.used_*)을 재계산합니다...")
+        count = rebuild_user_quota_usage(db)
+        print(f"✅ 쿼터 사용량 갱신 완료: {count}명")
+    except Exception as e:
+        print(f"🚨 에러 발생: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    backfill_usage()
@@ -0,0 +1,52 @@
+import asyncio
+import statistics
+import sys
+import time
+import httpx
+from fake_prometheus import FakePrometheus
+
+# ==========================================
+# Prometheus 클라이언트 재사용 벤치마크
+# ==========================================
+# 로컬 가짜 Prometheus(fake_prometheus.py)를 띄우고
+#   - 쿼리마다 httpx.AsyncClient 생성 (기존 방식)
+#   - 워커 수명 동안 공용 클라이언트 재사용 (현재 방식)
+# 의 요청당 지연 시간을 비교합니다.
+# 사용법: python bench_prometheus_client.py [요청 수]
+
+QUERY = '100 - (avg by (instance) (rate(node_cpu_seconds_total{mode="idle"}[1m])) * 100)'
+
+async def per_query_client(url: str, n: int) -> list:
+    timings = []
+    for _ in range(n):
+        started = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            await client.get(url, params={"query": QUERY}, timeout=3.0)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+async def shared_client(url: str, n: int) -> list:
+    timings = []
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+    async with httpx.AsyncClient(timeout=3.0, limits=limits) as client:
+        for _ in range(n):
+            started = time.perf_counter()
+            await client.get(url, params={"query": QUERY})
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def report(name: str, timings: list):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(timings):7.3f} ms | p50 {statistics.median(timings):7.3f} ms | p95 {p95:7.3f} ms")
+
+async def main(n: int):
+    server = await FakePrometheus(instances=10).start()
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/api/v1/query"
+    async with server:
+        report("per-query client", await per_query_client(url, n))
+        report("shared client", await shared_client(url, n))
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 300))
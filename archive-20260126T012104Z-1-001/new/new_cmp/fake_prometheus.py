@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import csv
+import json
+import math
+import re
+import sys
+import time
+import urllib.parse
+
+# ==========================================
+# 가짜 Prometheus (모니터링 경로 오프라인 부하 테스트용)
+# ==========================================
+# node_exporter 기반 cpu/memory/disk 사용률 형태의 시계열을 N개 인스턴스에 대해 합성합니다.
+#   - /api/v1/query, /api/v1/query_range 지원 (HTTP/1.1 keep-alive)
+#   - label_replace(..., "metric", "<종류>", "", "") 로 결합된 쿼리와 단일 쿼리 모두 처리
+#   - instance=~"..." 매처가 있으면 해당 인스턴스만 반환
+#   - --latency 로 응답 지연(ms) 주입
+# 사용법:
+#   python fake_prometheus.py --instances 500 --latency 20 --port 9090
+#   python fake_prometheus.py --instances 500 --dump-pool vms.csv   # import_pool.py 용 CSV 생성
+#   PROMETHEUS_URL=http://127.0.0.1:9090 uvicorn main:app ...
+
+METRIC_HINTS = {
+    "cpu": "node_cpu_seconds_total",
+    "memory": "node_memory_MemAvailable_bytes",
+    "disk": "node_filesystem_avail_bytes",
+}
+
+def instance_ip(i: int) -> str:
+    return f"192.168.{10 + i // 250}.{i % 250 + 1}"
+
+class FakePrometheus:
+    def __init__(self, instances: int = 50, latency_ms: float = 0.0):
+        self.ips = [instance_ip(i) for i in range(instances)]
+        self.latency = latency_ms / 1000.0
+        self.requests = 0
+
+    # ---------- 시계열 합성 ----------
+    @staticmethod
+    def value(m_type: str, idx: int, ts: float) -> float:
+        base = {"cpu": 35.0, "memory": 55.0, "disk": 40.0}[m_type]
+        amp = {"cpu": 30.0, "memory": 10.0, "disk": 2.0}[m_type]
+        return round(min(100.0, max(0.0, base + amp * math.sin(ts / 300.0 + idx * 0.7))), 3)
+
+    @staticmethod
+    def requested_metrics(query: str) -> list:
+        tagged = re.findall(r'"metric",\s*"(\w+)"', query)
+        if tagged:
+            return [(m, True) for m in tagged]
+        return [(m, False) for m, hint in METRIC_HINTS.items() if hint in query][:1]
+
+    def matched_ips(self, query: str) -> list:
+        m = re.search(r'instance=~"((?:[^"\\]|\\.)*)"', query)
+        if not m:
+            return list(enumerate(self.ips))
+        # PromQL 문자열 escape(\\) 해제 후 정규식으로 사용
+        pattern = re.compile(m.group(1).replace("\\\\", "\\"))
+        return [(i, ip) for i, ip in enumerate(self.ips) if pattern.fullmatch(f"{ip}:9100")]
+
+    def series(self, query: str, timestamps: list, is_range: bool) -> list:
+        result = []
+        targets = self.matched_ips(query)
+        for m_type, tagged in self.requested_metrics(query):
+            for idx, ip in targets:
+                labels = {"instance": f"{ip}:9100", "job": "node"}
+                if tagged:
+                    labels["metric"] = m_type
+                points = [[ts, str(self.value(m_type, idx, ts))] for ts in timestamps]
+                if is_range:
+                    result.append({"metric": labels, "values": points})
+                else:
+                    result.append({"metric": labels, "value": points[0]})
+        return result
+
+    def respond(self, path: str, params: dict) -> tuple:
+        query = params.get("query", "")
+        if path == "/api/v1/query":
+            ts = float(params.get("time", time.time()))
+            data = {"resultType": "vector", "result": self.series(query, [ts], False)}
+        elif path == "/api/v1/query_range":
+            start, end = float(params["start"]), float(params["end"])
+            step = max(float(params.get("step", 15)), 1.0)
+            count = min(int((end - start) / step) + 1, 11000)
+            data = {"resultType": "matrix", "result": self.series(query, [start + i * step for i in range(count)], True)}
+        else:
+            return 404, {"status": "error", "error": f"unknown path {path}"}
+        return 200, {"status": "success", "data": data}
+
+    # ---------- HTTP 처리 ----------
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n\r\n")
+                request_line = header.split(b"\r\n", 1)[0].decode()
+                _, target, _ = request_line.split(" ", 2)
+                url = urllib.parse.urlsplit(target)
+                params = dict(urllib.parse.parse_qsl(url.query))
+
+                length = re.search(rb"(?i)content-length:\s*(\d+)", header)
+                if length:
+                    body = await reader.readexactly(int(length.group(1)))
+                    params.update(urllib.parse.parse_qsl(body.decode()))
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                code, payload = self.respond(url.path, params)
+                body = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {code} {'OK' if code == 200 else 'Not Found'}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        return await asyncio.start_server(self.handle, host, port)
+
+def dump_pool(path: str, instances: int):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["vm_name", "ip_address"])
+        for i in range(instances):
+            writer.writerow([f"wkld-{i + 1:04d}", instance_ip(i)])
+    print(f"✅ {instances}개 VM 목록을 {path} 에 저장했습니다.")
+
+async def serve(args):
+    fake = FakePrometheus(args.instances, args.latency)
+    server = await fake.start(args.host, args.port)
+    print(f"🚀 Fake Prometheus: http://{args.host}:{args.port} (instances={args.instances}, latency={args.latency}ms)")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="node_exporter 형태의 시계열을 합성하는 가짜 Prometheus")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9090)
+    parser.add_argument("--instances", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--dump-pool", metavar="CSV", help="인스턴스 목록을 import_pool.py 용 CSV로 저장 후 종료")
+    args = parser.parse_args()
+
+    if args.dump_pool:
+        dump_pool(args.dump_pool, args.instances)
+        sys.exit(0)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,126 @@
+import csv
+import io
+import ipaddress
+import json
+import sys
+import time
+from main import engine
+
+# ==========================================
+# 워크로드 풀 대량 등록 (CSV / JSON / JSON Lines)
+# ==========================================
+# 사용법: python import_pool.py vms.csv
+#   - CSV: vm_name,ip_address 헤더 필요
+#   - JSON: [{"vm_name": ..., "ip_address": ...}, ...]
+#   - JSON Lines(.jsonl): 한 줄에 레코드 1개
+# 레코드를 스트리밍으로 COPY 하여 임시 staging 테이블에 적재한 뒤,
+# ip_address 기준 단일 UPSERT 문으로 workload_pool 에 반영합니다. (재실행해도 안전)
+
+UPSERT_SQL = """
+WITH src AS (
+    SELECT DISTINCT ON (ip_address) ip_address, vm_name
+    FROM pool_staging
+    ORDER BY ip_address
+), upsert AS (
+    INSERT INTO workload_pool (ip_address, vm_name, status)
+    SELECT ip_address, vm_name, 'available' FROM src
+    ON CONFLICT (ip_address) DO UPDATE SET vm_name = EXCLUDED.vm_name
+    WHERE workload_pool.vm_name IS DISTINCT FROM EXCLUDED.vm_name
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    (SELECT count(*) FROM src),
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM upsert
+"""
+
+def read_records(path: str):
+    """파일 확장자에 따라 (vm_name, ip_address) 레코드를 순차적으로 반환"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield row.get("vm_name"), row.get("ip_address")
+        elif path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield row.get("vm_name"), row.get("ip_address")
+        else:
+            for row in json.load(f):
+                yield row.get("vm_name"), row.get("ip_address")
+
+class CopyStream:
+    """레코드 이터레이터를 COPY FROM STDIN 이 읽을 수 있는 파일 객체로 변환 (메모리 일정)"""
+
+    def __init__(self, records):
+        self.records = records
+        self.buffer = ""
+        self.skipped = 0
+
+    def _next_line(self):
+        for vm_name, ip in self.records:
+            try:
+                ip = str(ipaddress.ip_address((ip or "").strip()))
+            except ValueError:
+                self.skipped += 1
+                continue
+            out = io.StringIO()
+            csv.writer(out).writerow([ip, (vm_name or "").strip() or ip])
+            return out.getvalue()
+        return ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            line = self._next_line()
+            if not line:
+                break
+            self.buffer += line
+        if size < 0:
+            chunk, self.buffer = self.buffer, ""
+        else:
+            chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        return chunk
+
+def import_pool(path: str) -> dict:
+    started = time.monotonic()
+    stream = CopyStream(read_records(path))
+
+    raw = engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        cur.execute(
+            "CREATE TEMP TABLE pool_staging (ip_address VARCHAR, vm_name VARCHAR) ON COMMIT DROP"
+        )
+        cur.copy_expert("COPY pool_staging (ip_address, vm_name) FROM STDIN WITH (FORMAT csv)", stream)
+        cur.execute(UPSERT_SQL)
+        total, inserted, updated = cur.fetchone()
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": total - inserted - updated,
+        "skipped": stream.skipped,
+        "elapsed": round(time.monotonic() - started, 2),
+    }
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("사용법: python import_pool.py <vms.csv|vms.json|vms.jsonl>")
+        sys.exit(1)
+    try:
+        result = import_pool(sys.argv[1])
+    except Exception as e:
+        print(f"🚨 에러 발생: {e}")
+        sys.exit(1)
+    print(
+        f"✅ 워크로드 풀 등록 완료 ({result['elapsed']}s): "
+        f"신규 {result['inserted']} / 변경 {result['updated']} / 동일 {result['unchanged']}"
+        f" / 형식 오류 건너뜀 {result['skipped']}"
+    )
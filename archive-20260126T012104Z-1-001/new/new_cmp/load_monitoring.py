@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+import httpx
+from jose import jwt
+
+# ==========================================
+# /api/monitoring/my-resources 부하 발생기
+# ==========================================
+# K명의 동시 사용자가 각각 R회씩 엔드포인트를 호출하고 p50/p95/p99 지연 시간을 보고합니다.
+# fake_prometheus.py 와 함께 사용하면 실제 Prometheus 없이 모니터링 경로 회귀를 확인할 수 있습니다.
+# 사용법:
+#   SECRET_KEY=... python load_monitoring.py --url http://127.0.0.1:8000 --users 50 --requests 20
+#   python load_monitoring.py --token <JWT> ...   # 발급받은 토큰 사용
+# 일반 사용자 토큰(loadtest{i})은 소유 VM이 없으면 빈 목록을 즉시 반환하므로 모니터링 경로를 측정하지 못합니다.
+# --seed N 을 주면 측정 전에 사용자마다 가용 VM N대를 소유한 프로젝트를 DB에 생성합니다. (서버와 같은 DB_URL 필요)
+#   python load_monitoring.py --seed 5 ...    # 재실행 시 이전 시드는 정리 후 다시 생성
+#   python load_monitoring.py --cleanup       # 시드 프로젝트 삭제 + VM 반납 후 종료
+# 서버의 기본 Rate Limit(my-resources 사용자당 60회/분)에 걸리지 않도록
+# 대상 서버는 RATE_LIMIT_RULES='[]' 로 기동하세요. (429 가 섞이면 지연 통계가 왜곡됨)
+
+ENDPOINT = "/api/monitoring/my-resources"
+SEED_SERVICE_NAME = "loadtest-monitoring"
+
+def cleanup_seed(db, ProjectHistory, WorkloadPool) -> int:
+    project_ids = [p.id for p in db.query(ProjectHistory.id).filter(ProjectHistory.service_name == SEED_SERVICE_NAME)]
+    if project_ids:
+        db.query(WorkloadPool).filter(WorkloadPool.project_id.in_(project_ids)).update(
+            {WorkloadPool.status: "available", WorkloadPool.project_id: None, WorkloadPool.occupy_user: None},
+            synchronize_session=False,
+        )
+        db.query(ProjectHistory).filter(ProjectHistory.id.in_(project_ids)).delete(synchronize_session=False)
+    return len(project_ids)
+
+def seed_projects(usernames: list, vms_per_user: int, cleanup_only: bool = False) -> int:
+    """사용자마다 가용 VM을 소유한 프로젝트 생성 (사용량 집계/쿼터에는 반영하지 않는 측정용 데이터)"""
+    # 서버 설정(DB_URL 등)을 그대로 사용하기 위해 필요할 때만 import
+    from main import SessionLocal, ProjectHistory, WorkloadPool
+
+    db = SessionLocal()
+    try:
+        removed = cleanup_seed(db, ProjectHistory, WorkloadPool)
+        if cleanup_only:
+            db.commit()
+            return removed
+
+        seeded = 0
+        for username in usernames:
+            vms = (
+                db.query(WorkloadPool)
+                .filter(WorkloadPool.status == "available")
+                .order_by(WorkloadPool.id.asc())
+                .limit(vms_per_user)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if len(vms) < vms_per_user:
+                print(f"⚠️ 가용 VM 부족: {seeded}/{len(usernames)}명만 시드되었습니다.")
+                break
+            project = ProjectHistory(
+                service_name=SEED_SERVICE_NAME, status="COMPLETED", template_type="loadtest",
+                owner=username, assigned_ip=", ".join(vm.ip_address for vm in vms),
+                details={"vm_names": [vm.vm_name for vm in vms]},
+            )
+            db.add(project)
+            db.flush()
+            for vm in vms:
+                vm.status = "assigned"
+                vm.project_id = project.id
+                vm.occupy_user = username[:20]
+            seeded += 1
+        db.commit()
+        return seeded
+    finally:
+        db.close()
+
+def mint_token(username: str, role: str) -> str:
+    secret = os.getenv("SECRET_KEY")
+    if not secret:
+        raise SystemExit("🚨 --token 을 지정하거나 서버와 동일한 SECRET_KEY 환경 변수를 설정하세요.")
+    payload = {"sub": username, "role": role, "exp": datetime.utcnow() + timedelta(hours=1)}
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+async def run_user(client: httpx.AsyncClient, token: str, requests: int, timings: list, errors: list, empty: list):
+    headers = {"Authorization": f"Bearer {token}"}
+    for _ in range(requests):
+        started = time.perf_counter()
+        try:
+            response = await client.get(ENDPOINT, headers=headers)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        timings.append((time.perf_counter() - started) * 1000)
+        # 빈 목록은 스냅샷/Prometheus 조회 없이 바로 반환된 응답 (측정 대상 경로가 아님)
+        if response.content.strip() == b"[]":
+            empty.append(1)
+
+async def main(args):
+    # 사용자별로 다른 계정 (admin 비율만큼 관리자)
+    accounts = []
+    for i in range(args.users):
+        role = "admin" if i < args.users * args.admin_ratio else "user"
+        accounts.append(("admin" if role == "admin" else f"{args.user_prefix}{i}", role))
+
+    if args.cleanup:
+        print(f"🧹 시드 프로젝트 {seed_projects([], 0, cleanup_only=True)}개 삭제")
+        return
+    if args.seed and not args.token:
+        usernames = [name for name, role in accounts if role == "user"]
+        seeded = seed_projects(usernames, args.seed)
+        print(f"🌱 일반 사용자 {seeded}명에게 VM {args.seed}대씩 소유 프로젝트 생성")
+
+    tokens = [args.token if args.token else mint_token(name, role) for name, role in accounts]
+
+    timings, errors, empty = [], [], []
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.url, timeout=30.0, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[run_user(client, t, args.requests, timings, errors, empty) for t in tokens])
+        elapsed = time.perf_counter() - started
+
+    timings.sort()
+    total = len(timings) + len(errors)
+    print(f"📊 {args.url}{ENDPOINT} | users={args.users} requests/user={args.requests}")
+    print(f"   완료 {len(timings)}/{total} (실패 {len(errors)}) | {total / elapsed:.1f} req/s")
+    if timings:
+        print(
+            f"   p50 {percentile(timings, 50):.1f} ms | p95 {percentile(timings, 95):.1f} ms"
+            f" | p99 {percentile(timings, 99):.1f} ms | max {timings[-1]:.1f} ms"
+            f" | mean {statistics.mean(timings):.1f} ms"
+        )
+    if errors:
+        print(f"   실패 예시: {errors[:5]}")
+    if empty:
+        print(
+            f"   ⚠️ 빈 응답([]) {len(empty)}/{len(timings)}건: 소유 VM이 없는 사용자의 즉시 반환이 지연 통계에 포함됨."
+            f" --seed N 으로 사용자별 VM을 생성한 뒤 측정하세요."
+        )
+    if 429 in errors:
+        print("   ⚠️ 429 응답 포함: 서버를 RATE_LIMIT_RULES='[]' 로 기동한 뒤 다시 측정하세요.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모니터링 API 부하 발생기")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=10, help="동시 사용자 수 (K)")
+    parser.add_argument("--requests", type=int, default=20, help="사용자당 요청 수")
+    parser.add_argument("--token", help="모든 사용자가 사용할 JWT (미지정 시 SECRET_KEY로 발급)")
+    parser.add_argument("--admin-ratio", type=float, default=0.1, help="발급 토큰 중 관리자 비율")
+    parser.add_argument("--user-prefix", default="loadtest", help="일반 사용자 이름 접두어")
+    parser.add_argument("--seed", type=int, default=0, metavar="N", help="측정 전 일반 사용자마다 VM N대를 소유한 프로젝트 생성 (DB_URL 필요)")
+    parser.add_argument("--cleanup", action="store_true", help="시드 프로젝트를 삭제하고 VM을 반납한 뒤 종료")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,94 @@
+import sys
+from sqlalchemy import text
+from main import engine, Base
+
+# ==========================================
+# 스키마 마이그레이션 (버전 관리)
+# ==========================================
+# uvicorn 워커가 import 시점마다 create_all 을 실행하지 않도록
+# 배포 시 1회 `python migrate.py` 로 스키마를 적용합니다.
+# 새 스키마 변경은 MIGRATIONS 끝에 (버전, 설명, 함수) 형태로 추가합니다.
+
+MIGRATION_LOCK_ID = 726001  # 여러 서버가 동시에 실행해도 한 곳만 적용
+
+def _create_tables(conn):
+    Base.metadata.create_all(bind=conn)
+
+def _create_hotpath_indexes(conn):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+def _add_quota_usage_columns(conn):
+    # 기존 행은 0으로 채워짐 -> 배포 후 `python backfill_usage.py` 로 실제 사용량 재계산
+    for column in ("used_vms", "used_cpu", "used_ram", "used_disk"):
+        conn.execute(text(f"ALTER TABLE user_quotas ADD COLUMN IF NOT EXISTS {column} INTEGER NOT NULL DEFAULT 0"))
+
+def _seed_usage_aggregate(conn):
+    # 집계 행(id=1)을 미리 생성 -> 런타임은 UPDATE만 수행 (최초 주문 동시 INSERT 경합 방지)
+    # 기존 데이터가 있으면 `python backfill_usage.py` 로 실제 값 재계산
+    conn.execute(text(
+        "INSERT INTO usage_aggregate (id, total_projects, used_vcpu, used_memory, updated_at)"
+        " VALUES (1, 0, 0, 0, now()) ON CONFLICT (id) DO NOTHING"
+    ))
+
+MIGRATIONS = [
+    (1, "initial schema", _create_tables),
+    (2, "hot-path composite indexes", _create_hotpath_indexes),
+    (3, "user quota usage counters", _add_quota_usage_columns),
+    (4, "seed usage aggregate row", _seed_usage_aggregate),
+]
+
+# 인덱스 사용 여부 확인용 대표 쿼리
+HOT_QUERIES = {
+    "ix_workload_pool_status_id": "SELECT id FROM workload_pool WHERE status = 'available' ORDER BY id LIMIT 5",
+    "ix_workload_pool_project_id": "SELECT id FROM workload_pool WHERE project_id = 1",
+    "ix_projects_owner_id_desc": "SELECT id FROM projects WHERE owner = 'admin' ORDER BY id DESC",
+    "ix_users_status": "SELECT id FROM users WHERE status = 'pending'",
+}
+
+def current_version(conn) -> int:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        " version INTEGER PRIMARY KEY,"
+        " description VARCHAR NOT NULL,"
+        " applied_at TIMESTAMP NOT NULL DEFAULT now())"
+    ))
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
+
+def migrate():
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        version = current_version(conn)
+        pending = [m for m in MIGRATIONS if m[0] > version]
+        if not pending:
+            print(f"✅ 스키마가 최신 상태입니다. (version {version})")
+            return
+
+        for ver, desc, func in pending:
+            print(f"🚀 [Migration] v{ver} 적용 중: {desc}")
+            func(conn)
+            conn.execute(
+                text("INSERT INTO schema_version (version, description) VALUES (:v, :d)"),
+                {"v": ver, "d": desc}
+            )
+        print(f"✅ 스키마 v{pending[-1][0]} 적용 완료")
+
+def explain_hot_queries() -> bool:
+    # 시퀀셜 스캔을 끄고 플래너가 인덱스를 선택하는지 확인 (소규모 테이블에서도 판정 가능)
+    ok = True
+    with engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+        for index_name, query in HOT_QUERIES.items():
+            plan = "\n".join(row[0] for row in conn.execute(text(f"EXPLAIN {query}")))
+            used = index_name in plan
+            ok = ok and used
+            print(f"{'✅' if used else '❌'} {index_name}: {query}")
+            if not used:
+                print(plan)
+    return ok
+
+if __name__ == "__main__":
+    if "--explain" in sys.argv:
+        sys.exit(0 if explain_hot_queries() else 1)
+    migrate()
@@ -0,0 +1,55 @@
+"""
+사용자 비밀번호 해시 (scrypt)
+
+main.py의 프로세스 풀(spawn) 워커에서 실행되므로 표준 라이브러리만 사용하는 가벼운 모듈로 분리합니다.
+워커는 작업 함수를 이 모듈 경로로 찾으므로 main.py 를 import 하지 않습니다.
+단, spawn 은 부모의 __main__ 스크립트를 다시 실행하므로 main.py 를 직접 __main__ 으로 실행하지 않습니다.
+(`python main.py` 는 `python -m uvicorn main:app` 으로 다시 실행됨)
+
+저장 형식: scrypt$<n>$<r>$<p>$<salt(base64)>$<hash(base64)>
+"""
+import base64
+import hashlib
+import hmac
+import os
+
+PREFIX = "scrypt"
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+def _maxmem(n: int, r: int) -> int:
+    # scrypt 작업 메모리(128 * r * n) + 여유분 (OpenSSL 기본 한도 32MiB를 넘는 설정 허용)
+    return 128 * r * n + 16 * 1024 * 1024
+
+def hash_password(password: str, n: int, r: int, p: int) -> str:
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=_maxmem(n, r), dklen=HASH_BYTES)
+    return "$".join([
+        PREFIX, str(n), str(r), str(p),
+        base64.b64encode(salt).decode(), base64.b64encode(digest).decode(),
+    ])
+
+def verify_password(password: str, stored: str) -> bool:
+    try:
+        prefix, n, r, p, salt, digest = stored.split("$")
+        n, r, p = int(n), int(r), int(p)
+        salt, expected = base64.b64decode(salt), base64.b64decode(digest)
+    except ValueError:
+        return False
+    if prefix != PREFIX:
+        return False
+    actual = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=_maxmem(n, r), dklen=len(expected))
+    return hmac.compare_digest(actual, expected)
+
+def is_password_hash(stored: str) -> bool:
+    return stored.startswith(PREFIX + "$")
+
+def needs_rehash(stored: str, n: int, r: int, p: int) -> bool:
+    """구 형식(Fernet)이거나 비용 설정이 바뀐 해시면 True"""
+    if not is_password_hash(stored):
+        return True
+    try:
+        _, sn, sr, sp, _, _ = stored.split("$")
+        return (int(sn), int(sr), int(sp)) != (n, r, p)
+    except ValueError:
+        return True
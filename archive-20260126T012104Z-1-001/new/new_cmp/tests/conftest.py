@@ -0,0 +1,54 @@
+import base64
+import os
+import sys
+import tempfile
+
+import pytest
+
+# ==========================================
+# 테스트 공통 설정
+# ==========================================
+# DB 관련 테스트는 PostgreSQL 이 필요합니다. (EXPLAIN / 부분 인덱스 / ON CONFLICT)
+#   TEST_DATABASE_URL=postgresql://admin:pw@127.0.0.1:5432/cmp_test pytest -q tests
+# 미설정 시 DB 테스트는 skip 됩니다. 테스트 전용 DB를 사용하세요. (스키마 마이그레이션이 적용됨)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+NEW_CMP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main.py 는 import 시점에 환경 변수를 읽으므로 import 전에 지정
+if TEST_DATABASE_URL:
+    os.environ["DB_URL"] = TEST_DATABASE_URL
+    os.environ["DB_READ_URL"] = TEST_DATABASE_URL
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ENCRYPT_KEY", base64.urlsafe_b64encode(os.urandom(32)).decode())  # Fernet 키 형식
+sys.path.insert(0, NEW_CMP_DIR)
+
+@pytest.fixture(scope="session")
+def main():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL(PostgreSQL) 미설정")
+    # app.mount("/templates") 가 현재 디렉터리 기준이므로 빈 디렉터리를 준비
+    workdir = tempfile.mkdtemp(prefix="cmp-test-")
+    os.makedirs(os.path.join(workdir, "templates"), exist_ok=True)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import main as main_module
+        import migrate
+        migrate.migrate()
+    finally:
+        os.chdir(cwd)
+    return main_module
+
+@pytest.fixture
+def db(main):
+    # 테스트마다 트랜잭션을 열고 끝나면 롤백 (테스트 DB에 데이터가 남지 않음)
+    connection = main.engine.connect()
+    transaction = connection.begin()
+    session = main.SessionLocal(bind=connection)
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
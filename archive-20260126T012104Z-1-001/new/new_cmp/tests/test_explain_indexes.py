@@ -0,0 +1,16 @@
+import pytest
+
+text = pytest.importorskip("sqlalchemy").text
+
+def test_hot_queries_use_indexes(main, db):
+    # migrate.py --explain 과 같은 대표 쿼리로 플래너가 인덱스를 선택하는지 확인
+    # 테스트 DB는 행이 적으므로 시퀀셜 스캔을 끄고 판정 (SET LOCAL -> 롤백 시 원복)
+    import migrate
+
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    missing = {}
+    for index_name, query in migrate.HOT_QUERIES.items():
+        plan = "\n".join(row[0] for row in db.execute(text(f"EXPLAIN {query}")))
+        if index_name not in plan:
+            missing[index_name] = plan
+    assert not missing, missing
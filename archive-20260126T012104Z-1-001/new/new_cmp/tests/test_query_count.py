@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+
+import pytest
+
+event = pytest.importorskip("sqlalchemy.event")
+
+TEST_OWNER = "qc-tester"
+
+@contextmanager
+def count_queries(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+def add_vms(main, db, start, count):
+    project = main.ProjectHistory(service_name=f"qc-svc-{start}", owner=TEST_OWNER, status="PROVISIONED", details={})
+    db.add(project)
+    db.flush()
+    db.add_all([
+        main.WorkloadPool(
+            vm_name=f"qc-vm-{i}", ip_address=f"10.254.{i // 250}.{i % 250 + 1}",
+            status="assigned", project_id=project.id, occupy_user=TEST_OWNER,
+        )
+        for i in range(start, start + count)
+    ])
+    db.flush()
+
+def load_my_resources(main, db):
+    # /api/monitoring/my-resources 일반 사용자 경로와 동일한 조회 + 응답 행 생성
+    rows = main.vm_resource_query(db).filter(main.ProjectHistory.owner == TEST_OWNER).all()
+    return main.build_resource_rows(rows, {})
+
+def test_my_resources_query_count_is_constant(main, db):
+    add_vms(main, db, 0, 1)
+    with count_queries(main.engine) as one_vm:
+        assert len(load_my_resources(main, db)) == 1
+
+    add_vms(main, db, 1, 199)
+    with count_queries(main.engine) as many_vms:
+        assert len(load_my_resources(main, db)) == 200
+
+    # VM/프로젝트 수와 무관하게 LEFT JOIN 1회 (N+1 없음)
+    assert len(one_vm) == 1
+    assert len(many_vms) == len(one_vm)